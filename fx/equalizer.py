@@ -1,14 +1,31 @@
 import numpy as np
 from scipy.signal import butter, sosfilt
 
+# Crossover frequencies
+LOW_CUT = 400   # Hz
+HIGH_CUT = 3000 # Hz
+
+def _crossover(sr):
+    # Design Filters (Butterworth 2nd order)
+    sos_low = butter(2, LOW_CUT, btype='low', fs=sr, output='sos')
+    sos_high = butter(2, HIGH_CUT, btype='high', fs=sr, output='sos')
+    return sos_low, sos_high
+
+def equalizer_kernel(sr=44100, low_gain=1.0, mid_gain=1.0, high_gain=1.0, mix=1.0, length_ms=50.0):
+    # Impulse response of the whole EQ stage, truncated to length_ms.
+    # The 2nd-order crossovers ring for well under a millisecond, so 50 ms is exact to float precision.
+    delta = np.zeros(max(1, int(sr * length_ms / 1000)))
+    delta[0] = 1.0
+    sos_low, sos_high = _crossover(sr)
+    low_band = sosfilt(sos_low, delta)
+    high_band = sosfilt(sos_high, delta)
+    mid_band = delta - (low_band + high_band)
+    h = (low_band * low_gain) + (mid_band * mid_gain) + (high_band * high_gain)
+    return (1 - mix) * delta + mix * h
+
 def equalizer_fx(x, sr=44100, low_gain=1.0, mid_gain=1.0, high_gain=1.0, mix=1.0):
-    # Crossover frequencies
-    low_cut = 400   # Hz
-    high_cut = 3000 # Hz
-    
-    # 1. Design Filters (Butterworth 2nd order)
-    sos_low = butter(2, low_cut, btype='low', fs=sr, output='sos')
-    sos_high = butter(2, high_cut, btype='high', fs=sr, output='sos')
+    # 1. Design Filters
+    sos_low, sos_high = _crossover(sr)
     # Bandpass is tricky to sum perfectly, so we subtract low and high from original to get mid
     
     # 2. Filter Separation
@@ -24,4 +41,4 @@ def equalizer_fx(x, sr=44100, low_gain=1.0, mid_gain=1.0, high_gain=1.0, mix=1.0
     
     # Safety Check
     m = np.max(np.abs(out)) + 1e-9
-    return out / m if m > 1.0 else out
\ No newline at end of file
+    return out / m if m > 1.0 else out
@@ -1,6 +1,6 @@
 import numpy as np, soundfile as sf
 from scipy.signal import fftconvolve
-def reverb_fx(x, sr, ir_path='assets/impulse_responses/room.wav', mix=0.3, pre_delay_ms=0.0):
+def load_ir(ir_path, sr, pre_delay_ms=0.0):
     ir, ir_sr = sf.read(ir_path)
     if ir.ndim > 1: ir = ir.mean(axis=1)
     if ir_sr != sr:
@@ -11,6 +11,14 @@ def reverb_fx(x, sr, ir_path='assets/impulse_responses/room.wav', mix=0.3, pre_d
     if pre_delay_ms > 0:
         zeros = np.zeros(int(sr*pre_delay_ms/1000))
         ir = np.concatenate([zeros, ir])
+    return ir
+def reverb_kernel(sr, ir_path='assets/impulse_responses/room.wav', mix=0.3, pre_delay_ms=0.0):
+    # Dry + wet as a single FIR: h = (1 - mix)·δ + mix·h_room
+    h = mix * load_ir(ir_path, sr, pre_delay_ms)
+    h[0] += 1 - mix
+    return h
+def reverb_fx(x, sr, ir_path='assets/impulse_responses/room.wav', mix=0.3, pre_delay_ms=0.0):
+    ir = load_ir(ir_path, sr, pre_delay_ms)
     y = fftconvolve(x, ir, mode="full")[:len(x)]
     out = (1 - mix) * x + mix * y
     m = np.max(np.abs(out)) + 1e-9
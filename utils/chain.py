@@ -1,6 +1,10 @@
+from functools import lru_cache
+import numpy as np
+from scipy.signal import fftconvolve
+
 # Existing imports
 from fx.delay import delay_fx
-from fx.reverb import reverb_fx
+from fx.reverb import reverb_fx, reverb_kernel
 from fx.overdrive import overdrive_fx
 from fx.compressor import compressor_fx
 
@@ -9,7 +13,7 @@ from fx.compressor import compressor_fx
 from fx.distortion import distortion_fx
 from fx.tremolo import tremolo_fx
 from fx.chorus import chorus_fx
-from fx.equalizer import equalizer_fx
+from fx.equalizer import equalizer_fx, equalizer_kernel
 
 # Map the string names (from main.py) to the actual functions
 EFFECTS = {
@@ -30,25 +34,79 @@ EFFECTS = {
     "Reverb":     lambda audio, sr, p: reverb_fx(audio, sr, **p),
 }
 
+# Linear time-invariant effects, mapped to a function returning their impulse response.
+# Runs of 2+ adjacent LTI stages are folded into one kernel and applied in a single convolution.
+LTI_KERNELS = {
+    "Equalizer":  lambda sr, p: equalizer_kernel(sr, **p),
+    "Reverb":     lambda sr, p: reverb_kernel(sr, **p),
+}
+
+def _freeze(params):
+    # dicts aren't hashable; turn params into a cache key
+    return tuple(sorted(params.items()))
+
+@lru_cache(maxsize=32)
+def _combined_kernel(sr, frozen_stages):
+    """
+    Convolves the impulse responses of a run of LTI stages into one FIR kernel.
+    Cached per (sr, stage names, params), so moving an unrelated knob doesn't rebuild it.
+    """
+    h = np.ones(1)
+    for fx_name, frozen in frozen_stages:
+        h = fftconvolve(h, LTI_KERNELS[fx_name](sr, dict(frozen)), mode="full")
+    h.setflags(write=False)
+    return h
+
+def _plan(chain):
+    """
+    Groups the chain into runs: adjacent LTI stages become one list, everything else stays alone.
+    """
+    runs = []
+    for stage in chain:
+        if stage[0] in LTI_KERNELS and runs and runs[-1][-1][0] in LTI_KERNELS:
+            runs[-1].append(stage)
+        else:
+            runs.append([stage])
+    return runs
+
+def _process_stage(y, sr, fx_name, params):
+    func = EFFECTS.get(fx_name)
+    if func:
+        try:
+            # **params unpacks the dictionary into arguments
+            # e.g. tremolo_fx(y, sr, rate=5.0, depth=0.5, mix=1.0)
+            return func(y, sr, params)
+        except TypeError as e:
+            print(f"⚠️ Error processing {fx_name}: {e}")
+            # If parameters don't match, return dry signal for this stage
+            return y
+    print(f"⚠️ Effect '{fx_name}' not found in EFFECTS dictionary.")
+    return y
+
 def process_chain(audio, sr, chain):
     """
     Takes an audio signal and a list of (effect_name, params_dict).
     Passes the audio through each effect sequentially.
+
+    Adjacent LTI stages (e.g. Equalizer → Reverb) are merged into a single convolution
+    with a cached combined impulse response, so EQ + Reverb costs about the same as Reverb.
+    The merged run is peak-normalised once at its output rather than after every stage.
     """
     y = audio.copy()
     
-    for fx_name, params in chain:
-        func = EFFECTS.get(fx_name)
-        if func:
+    for run in _plan(chain):
+        if len(run) > 1:
             try:
-                # **params unpacks the dictionary into arguments
-                # e.g. tremolo_fx(y, sr, rate=5.0, depth=0.5, mix=1.0)
-                y = func(y, sr, params)
+                h = _combined_kernel(sr, tuple((n, _freeze(p)) for n, p in run))
             except TypeError as e:
-                print(f"⚠️ Error processing {fx_name}: {e}")
-                # If parameters don't match, return dry signal for this stage
+                # Bad params somewhere in the run: fall back to stage-by-stage processing
+                print(f"⚠️ Could not merge {' → '.join(n for n, _ in run)}: {e}")
+            else:
+                out = fftconvolve(y, h, mode="full")[:len(y)]
+                m = np.max(np.abs(out)) + 1e-9
+                y = out / m if m > 1.0 else out
                 continue
-        else:
-            print(f"⚠️ Effect '{fx_name}' not found in EFFECTS dictionary.")
+        for fx_name, params in run:
+            y = _process_stage(y, sr, fx_name, params)
             
     return y
\ No newline at end of file